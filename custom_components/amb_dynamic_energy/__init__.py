@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
@@ -19,13 +18,16 @@ PLATFORMS: list[Platform] = [Platform.SENSOR]
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up AMB Dynamic Energy from a config entry."""
-    # Initialize the coordinator and make first refresh
+    # Initialize the coordinator and run the first refresh in the background,
+    # so a slow or unreachable API does not hold up Home Assistant startup.
+    # Sensors report no value until the first data arrives.
     coordinator = AMBDataUpdateCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    entry.async_create_background_task(
+        hass, coordinator.async_refresh(), f"{DOMAIN} first refresh"
+    )
 
-    # Store the coordinator in the integration runtime data
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    # Store the coordinator in the config entry runtime data
+    entry.runtime_data = coordinator
 
     # Register the “device” in the Device Registry
     device_registry = dr.async_get(hass)
@@ -45,10 +47,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-    if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
-    return unload_ok
+    # runtime_data is cleared by Home Assistant once the entry is unloaded
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from typing import Any
 
+import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 
 from .const import (
@@ -43,20 +44,18 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return await self.async_step_user()
 
     @staticmethod
-    def async_get_options_flow(config_entry):
+    @callback
+    def async_get_options_flow(
+            config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
         """Return the options flow handler to allow changing API URL and interval after setup."""
-        from .config_flow import OptionsFlowHandler
-
-        return OptionsFlowHandler(config_entry)
+        # The config entry is exposed by the base OptionsFlow.config_entry property
+        return OptionsFlowHandler()
 
 
 class OptionsFlowHandler(config_entries.OptionsFlow):
     """Config flow options handler for AMB Dynamic Energy."""
 
-    def __init__(self, config_entry):
-        """Initialize options flow."""
-        self.config_entry = config_entry
-
     async def async_step_init(
             self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -71,18 +70,18 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             CONF_UPDATE_INTERVAL,
             self.config_entry.data.get(CONF_UPDATE_INTERVAL, int(DEFAULT_UPDATE_INTERVAL.total_seconds())),
         )
-        schema = {
-            vol.Optional(
-                CONF_API_URL, default=default_api_url
-            ): str,
-            vol.Optional(
-                CONF_UPDATE_INTERVAL, default=default_update_interval / 3600
-            ): float,
-        }
-
-        import voluptuous as vol
+        schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_API_URL, default=default_api_url
+                ): str,
+                vol.Optional(
+                    CONF_UPDATE_INTERVAL, default=default_update_interval / 3600
+                ): float,
+            }
+        )
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(schema),
+            data_schema=schema,
         )
@@ -9,11 +9,19 @@ DEFAULT_API_URL: Final = "https://amb-dynamic-current-api.uschti.ch/amb-data"
 DEFAULT_TIMEOUT: Final = 15
 DEFAULT_UPDATE_INTERVAL: Final = timedelta(hours=2)
 
+# Time Configuration
+ONE_DAY: Final = timedelta(days=1)
+
 # Retry Configuration
 RETRY_ATTEMPTS: Final = 5
 RETRY_INTERVAL: Final = timedelta(minutes=1)
 EXTENDED_RETRY_ATTEMPTS: Final = 20
 EXTENDED_RETRY_INTERVAL: Final = timedelta(minutes=10)
+# (attempts, interval) stages; stages after the first form the extended retry cycle
+RETRY_SCHEDULE: Final = (
+    (RETRY_ATTEMPTS, RETRY_INTERVAL),
+    (EXTENDED_RETRY_ATTEMPTS, EXTENDED_RETRY_INTERVAL),
+)
 
 # Sensor Configuration
 SENSOR_CURRENT_PRICE: Final = "current_price"
@@ -3,30 +3,70 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import Any
+import sys
+from datetime import date, timedelta
+from http import HTTPStatus
+from typing import Any, Final, NamedTuple
 
 import aiohttp
+from aiohttp import hdrs
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .const import (
     DOMAIN,
     DEFAULT_API_URL,
     DEFAULT_TIMEOUT,
     DEFAULT_UPDATE_INTERVAL,
-    RETRY_ATTEMPTS,
-    RETRY_INTERVAL,
-    EXTENDED_RETRY_ATTEMPTS,
-    EXTENDED_RETRY_INTERVAL,
+    ONE_DAY,
+    RETRY_SCHEDULE,
     CONF_API_URL,
     CONF_UPDATE_INTERVAL,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_CLIENT_TIMEOUT = aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)
+
+CHART_COLUMNS: Final = ("date", "start_time", "end_time", "price", "price_value", "timestamp")
+
+# Canonical price strings, so parsed periods share one object per price level
+_INTERNED_PRICES: dict[str, str] = {
+    price: sys.intern(price) for price in ("high", "low", "unknown")
+}
+# Upper-case display labels, computed once instead of on every sensor read
+_PRICE_LABELS: dict[str, str] = {
+    price: sys.intern(price.upper()) for price in _INTERNED_PRICES
+}
+
+
+class ParsedPeriod(NamedTuple):
+    """Forecast period with its hour range parsed into minutes since midnight."""
+
+    start_min: int
+    end_min: int
+    start: str
+    end: str
+    price: str
+    label: str  # upper-case price for display
+
+
+class PriceBlock(NamedTuple):
+    """Run of contiguous same-price periods, possibly spanning midnight.
+
+    Bounds are absolute local minutes: ``date.toordinal() * 1440 + minute_of_day``.
+    """
+
+    start_abs_min: int
+    end_abs_min: int
+    price: str
+    end_label: str  # "YYYY-MM-DD HH:MM" of end_abs_min
+    label: str  # upper-case price for display
+
 
 class AMBDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching AMB data from API."""
@@ -41,8 +81,22 @@ class AMBDataUpdateCoordinator(DataUpdateCoordinator):
         )
         update_interval = timedelta(seconds=update_interval_seconds)
 
-        self._retry_count = 0
-        self._extended_retry_count = 0
+        # Shared HA session: keeps the connection pool alive between polls
+        self._session = async_get_clientsession(hass)
+
+        self._recovering = False
+
+        # Validators for conditional GETs and the payload they refer to
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        self._last_raw: dict[str, Any] | None = None
+
+        # Derived structures for the last processed payload
+        self._raw_hash: int | None = None
+        self._by_date: dict[str, list[dict[str, Any]]] = {}
+        self._schedules: dict[str, tuple[ParsedPeriod, ...]] = {}
+        self._price_blocks: tuple[PriceBlock, ...] = ()
+        self._chart_data: dict[str, tuple[Any, ...]] = dict.fromkeys(CHART_COLUMNS, ())
 
         super().__init__(
             hass,
@@ -60,171 +114,298 @@ class AMBDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def _fetch_data_with_retry(self) -> dict[str, Any]:
         """Fetch data with retry logic."""
-        for attempt in range(1, RETRY_ATTEMPTS + 1):
-            try:
-                data = await self._fetch_data()
-                # Reset retry counts on success
-                self._retry_count = 0
-                self._extended_retry_count = 0
-                return self._process_data(data)
-
-            except aiohttp.ClientError as err:
-                _LOGGER.warning(
-                    "Attempt %d/%d failed to fetch AMB data: %s",
-                    attempt, RETRY_ATTEMPTS, err
-                )
-
-                if attempt == RETRY_ATTEMPTS:
-                    # Start extended retry cycle
-                    return await self._extended_retry()
-
-                await asyncio.sleep(RETRY_INTERVAL.total_seconds())
+        data = await self._retry(RETRY_SCHEDULE[:1])
+        if data is not None:
+            return data
 
-        raise UpdateFailed("Failed to fetch data after all retry attempts")
+        if self.data:
+            # Serve cached data now and keep retrying in the background
+            _LOGGER.warning("Using cached data due to API unavailability")
+            self._start_background_recovery()
+            return self.data
 
-    async def _extended_retry(self) -> dict[str, Any]:
-        """Extended retry with longer intervals."""
+        # Start extended retry cycle
         _LOGGER.info("Starting extended retry cycle")
+        data = await self._retry(RETRY_SCHEDULE[1:])
+        if data is None:
+            raise UpdateFailed("API unavailable and no cached data available")
+        return data
+
+    async def _retry(
+            self, schedule: tuple[tuple[int, timedelta], ...]
+    ) -> dict[str, Any] | None:
+        """Fetch data following (attempts, interval) stages, returning None if all attempts fail."""
+        for attempts, interval in schedule:
+            for attempt in range(1, attempts + 1):
+                try:
+                    return self._process_data(await self._fetch_data())
+
+                except (aiohttp.ClientError, TimeoutError) as err:
+                    _LOGGER.warning(
+                        "Attempt %d/%d failed to fetch AMB data: %s",
+                        attempt, attempts, err
+                    )
+
+                    if attempt < attempts:
+                        await asyncio.sleep(interval.total_seconds())
 
-        for attempt in range(1, EXTENDED_RETRY_ATTEMPTS + 1):
-            try:
-                data = await self._fetch_data()
-                self._extended_retry_count = 0
-                return self._process_data(data)
-
-            except aiohttp.ClientError as err:
-                _LOGGER.warning(
-                    "Extended attempt %d/%d failed: %s",
-                    attempt, EXTENDED_RETRY_ATTEMPTS, err
-                )
-
-                if attempt == EXTENDED_RETRY_ATTEMPTS:
-                    break
-
-                await asyncio.sleep(EXTENDED_RETRY_INTERVAL.total_seconds())
+        return None
 
-        # If we have cached data, return it with warning
-        if self.data:
-            _LOGGER.warning("Using cached data due to API unavailability")
-            return self.data
+    def _start_background_recovery(self) -> None:
+        """Run the extended retry cycle outside the coordinator update."""
+        if self._recovering:
+            return
+        self._recovering = True
+        self.config_entry.async_create_background_task(
+            self.hass, self._background_recover(), f"{DOMAIN} extended retry"
+        )
 
-        raise UpdateFailed("API unavailable and no cached data available")
+    async def _background_recover(self) -> None:
+        """Push fresh data to listeners once the API is reachable again."""
+        _LOGGER.info("Starting extended retry cycle")
+        try:
+            data = await self._retry(RETRY_SCHEDULE[1:])
+            if data is not None:
+                self.async_set_updated_data(data)
+        except Exception:
+            # Nothing awaits this task, so log here instead of leaking the error
+            _LOGGER.exception("Extended retry cycle for AMB data failed")
+        finally:
+            self._recovering = False
 
     async def _fetch_data(self) -> dict[str, Any]:
         """Fetch data from API."""
-        timeout = aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)
-
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(self.api_url) as response:
-                response.raise_for_status()
-                return await response.json()
+        headers: dict[str, str] = {}
+        if self._last_raw is not None:
+            if self._etag:
+                headers[hdrs.IF_NONE_MATCH] = self._etag
+            if self._last_modified:
+                headers[hdrs.IF_MODIFIED_SINCE] = self._last_modified
+
+        async with self._session.get(
+            self.api_url, headers=headers, timeout=_CLIENT_TIMEOUT, raise_for_status=True
+        ) as response:
+            if response.status == HTTPStatus.NOT_MODIFIED and self._last_raw is not None:
+                _LOGGER.debug("AMB data not modified since last fetch")
+                return self._last_raw
+
+            raw_data = await response.json(loads=json_loads)
+            self._etag = response.headers.get(hdrs.ETAG)
+            self._last_modified = response.headers.get(hdrs.LAST_MODIFIED)
+            self._last_raw = raw_data
+            return raw_data
 
     def _process_data(self, raw_data: dict[str, Any]) -> dict[str, Any]:
         """Process raw API data into structured format."""
         current_price = raw_data.get("current_price", "unknown")
         forecasts = raw_data.get("forecasts", [])
 
+        # Snapshot the clock once; helpers compare plain minute-of-day integers
         now = dt_util.now()
+        today = now.date()
+        today_str = today.isoformat()
+        tomorrow_str = (today + ONE_DAY).isoformat()
+        current_minutes = now.hour * 60 + now.minute
+
         processed_data = {
             "current_price": current_price,
             "forecasts": forecasts,
             "last_updated": now.isoformat(),
         }
 
+        # Index and parse forecast periods once per distinct payload; an unchanged
+        # payload reuses the index and the schedules already parsed from it
+        raw_hash = hash(repr(raw_data))
+        if raw_hash != self._raw_hash:
+            self._raw_hash = raw_hash
+            self._by_date = {day.get("date"): day.get("forecast", []) for day in forecasts}
+            self._schedules = {
+                date_str: self._parse_periods(periods)
+                for date_str, periods in self._by_date.items()
+            }
+            self._price_blocks = self._build_price_blocks(self._schedules)
+            self._chart_data = self._build_chart_data(self._schedules)
+        by_date = self._by_date
+        processed_data["schedules"] = self._schedules
+        processed_data["price_blocks"] = self._price_blocks
+        processed_data["chart_data"] = self._chart_data
+
+        parsed_today = self._schedules.get(today_str, ())
+        parsed_tomorrow = self._schedules.get(tomorrow_str, ())
+
         # Find current and next price periods
-        current_period = self._find_current_period(forecasts, now)
+        current_period = self._find_current_period(parsed_today, current_minutes)
         if current_period:
             processed_data["current_period"] = current_period
-            processed_data["next_change"] = self._find_next_change(forecasts, now)
+            processed_data["next_change"] = self._find_next_change(
+                parsed_today, parsed_tomorrow, today_str, tomorrow_str, current_minutes
+            )
 
         # Separate today and tomorrow forecasts
-        today_str = now.strftime("%Y-%m-%d")
-        tomorrow_str = (now + timedelta(days=1)).strftime("%Y-%m-%d")
-
-        processed_data["today_schedule"] = self._get_day_schedule(forecasts, today_str)
-        processed_data["tomorrow_schedule"] = self._get_day_schedule(forecasts, tomorrow_str)
+        processed_data["today_schedule"] = by_date.get(today_str, [])
+        processed_data["tomorrow_schedule"] = by_date.get(tomorrow_str, [])
 
         return processed_data
 
-    def _find_current_period(self, forecasts: list, now: datetime) -> dict[str, Any] | None:
-        """Find current price period."""
-        today_str = now.strftime("%Y-%m-%d")
-        current_minutes = now.hour * 60 + now.minute
+    def _parse_periods(self, periods: list[dict[str, Any]]) -> tuple[ParsedPeriod, ...]:
+        """Parse raw forecast periods into an immutable, start-ordered tuple."""
+        parsed: list[ParsedPeriod] = []
+        # Bind hot lookups to locals for the loop below
+        parse_hour_range = self._parse_hour_range
+        intern_price = _INTERNED_PRICES.get
+        price_label = _PRICE_LABELS.get
+        append = parsed.append
+        for period in periods:
+            period_get = period.get
+            bounds = parse_hour_range(period_get("hour_range", ""))
+            if bounds is None:
+                continue
+            price = period_get("price", "unknown")
+            label = price_label(price)
+            if label is None:
+                label = price.upper() if isinstance(price, str) else price
+            append(ParsedPeriod(*bounds, intern_price(price, price), label))
+        # The API already returns periods in order; sorting keeps the early exits safe
+        parsed.sort(key=lambda p: p.start_min)
+        return tuple(parsed)
 
-        for day in forecasts:
-            if day.get("date") == today_str:
-                for period in day.get("forecast", []):
-                    hour_range = period.get("hour_range", "")
-                    if " - " in hour_range:
-                        start_str, end_str = hour_range.split(" - ")
-                        start_minutes = self._time_to_minutes(start_str)
-                        end_minutes = self._time_to_minutes(end_str)
-
-                        # Handle end of day case
-                        if end_str == "23:59":
-                            end_minutes = 24 * 60
-
-                        if start_minutes <= current_minutes < end_minutes:
-                            return {
-                                "price": period.get("price"),
-                                "start": start_str,
-                                "end": end_str,
-                                # Rimuovi remaining_minutes da qui - calcolato nel sensore
-                            }
-        return None
+    @staticmethod
+    def _build_price_blocks(
+            schedules: dict[str, tuple[ParsedPeriod, ...]]
+    ) -> tuple[PriceBlock, ...]:
+        """Merge contiguous same-price periods across all dates into one timeline."""
+        runs: list[list[Any]] = []  # [start, end, price, label] while merging
+        for date_str in sorted(filter(None, schedules)):
+            try:
+                day_base = date.fromisoformat(date_str).toordinal() * 24 * 60
+            except (TypeError, ValueError):
+                continue
+            for period in schedules[date_str]:
+                start = day_base + period.start_min
+                end = day_base + period.end_min
+                if runs and runs[-1][1] == start and runs[-1][2] == period.price:
+                    runs[-1][1] = end
+                else:
+                    runs.append([start, end, period.price, period.label])
+
+        blocks: list[PriceBlock] = []
+        for start, end, price, label in runs:
+            # Format the end label once here rather than on every sensor read
+            end_day, end_minutes = divmod(end, 24 * 60)
+            end_h, end_m = divmod(end_minutes, 60)
+            end_label = f"{date.fromordinal(end_day).isoformat()} {end_h:02d}:{end_m:02d}"
+            blocks.append(PriceBlock(start, end, price, end_label, label))
+        return tuple(blocks)
 
+    @staticmethod
+    def _build_chart_data(
+            schedules: dict[str, tuple[ParsedPeriod, ...]]
+    ) -> dict[str, tuple[Any, ...]]:
+        """Flatten the parsed schedules into chart columns (e.g. for ApexCharts).
+
+        One parallel tuple per ``CHART_COLUMNS`` entry, index ``i`` of every
+        column describing the same period, so each key is sent once.
+        """
+        dates: list[str] = []
+        starts: list[str] = []
+        ends: list[str] = []
+        prices: list[str] = []
+        price_values: list[int] = []
+        timestamps: list[str] = []
+        for date_str, periods in schedules.items():
+            for period in periods:
+                dates.append(date_str)
+                starts.append(period.start)
+                ends.append(period.end)
+                prices.append(period.price)
+                price_values.append(1 if period.price == "high" else 0)
+                timestamps.append(f"{date_str}T{period.start}:00")
+        return dict(
+            zip(
+                CHART_COLUMNS,
+                map(tuple, (dates, starts, ends, prices, price_values, timestamps)),
+            )
+        )
 
-    def _find_next_change(self, forecasts: list, now: datetime) -> dict[str, Any] | None:
-        """Find next price change."""
-        today_str = now.strftime("%Y-%m-%d")
-        tomorrow_str = (now + timedelta(days=1)).strftime("%Y-%m-%d")
-        current_minutes = now.hour * 60 + now.minute
+    @staticmethod
+    def _find_current_period(
+            parsed_today: tuple[ParsedPeriod, ...], current_minutes: int
+    ) -> dict[str, Any] | None:
+        """Find current price period."""
+        for period in parsed_today:
+            # Periods are ordered by start time: nothing later can match
+            if period.start_min > current_minutes:
+                break
+            if current_minutes < period.end_min:
+                return {
+                    "price": period.price,
+                    "start": period.start,
+                    "end": period.end,
+                    # Rimuovi remaining_minutes da qui - calcolato nel sensore
+                }
+        return None
 
-        # Check remaining periods today
-        for day in forecasts:
-            if day.get("date") == today_str:
-                for period in day.get("forecast", []):
-                    hour_range = period.get("hour_range", "")
-                    if " - " in hour_range:
-                        start_str, _ = hour_range.split(" - ")
-                        start_minutes = self._time_to_minutes(start_str)
-
-                        if start_minutes > current_minutes:
-                            return {
-                                "time": start_str,
-                                "price": period.get("price"),
-                                "date": today_str,
-                            }
+    @staticmethod
+    def _find_next_change(
+            parsed_today: tuple[ParsedPeriod, ...],
+            parsed_tomorrow: tuple[ParsedPeriod, ...],
+            today_str: str,
+            tomorrow_str: str,
+            current_minutes: int,
+    ) -> dict[str, Any] | None:
+        """Find next price change."""
+        # Check remaining periods today (ordered, so the first later start wins)
+        period = next((p for p in parsed_today if p.start_min > current_minutes), None)
+        if period:
+            return {
+                "time": period.start,
+                "price": period.price,
+                "date": today_str,
+            }
 
         # Check tomorrow's first period
-        for day in forecasts:
-            if day.get("date") == tomorrow_str:
-                forecast = day.get("forecast", [])
-                if forecast:
-                    first_period = forecast[0]
-                    hour_range = first_period.get("hour_range", "")
-                    if " - " in hour_range:
-                        start_str, _ = hour_range.split(" - ")
-                        return {
-                            "time": start_str,
-                            "price": first_period.get("price"),
-                            "date": tomorrow_str,
-                        }
+        if parsed_tomorrow:
+            first_period = parsed_tomorrow[0]
+            return {
+                "time": first_period.start,
+                "price": first_period.price,
+                "date": tomorrow_str,
+            }
 
         return None
 
-    def _get_day_schedule(self, forecasts: list, date_str: str) -> list[dict[str, Any]]:
-        """Get schedule for specific day."""
-        for day in forecasts:
-            if day.get("date") == date_str:
-                return day.get("forecast", [])
-        return []
+    @classmethod
+    def _parse_hour_range(cls, hour_range: str) -> tuple[int, int, str, str] | None:
+        """Parse "HH:MM - HH:MM" into (start_min, end_min, start, end), or None if malformed."""
+        # Fast path: fixed offsets for the canonical zero-padded format
+        if len(hour_range) == 13 and hour_range[5:8] == " - ":
+            try:
+                start_minutes = int(hour_range[0:2]) * 60 + int(hour_range[3:5])
+                end_minutes = int(hour_range[8:10]) * 60 + int(hour_range[11:13])
+            except ValueError:
+                pass
+            else:
+                # Handle end of day case
+                if end_minutes == 23 * 60 + 59:
+                    end_minutes = 24 * 60
+                return start_minutes, end_minutes, hour_range[0:5], hour_range[8:13]
+
+        start_str, sep, end_str = hour_range.partition(" - ")
+        if not sep:
+            return None
+        start_minutes = cls._time_to_minutes(start_str)
+        # Handle end of day case
+        end_minutes = 24 * 60 if end_str == "23:59" else cls._time_to_minutes(end_str)
+        return start_minutes, end_minutes, start_str, end_str
 
     @staticmethod
     def _time_to_minutes(time_str: str) -> int:
         """Convert HH:MM to minutes since midnight."""
         try:
-            hours, minutes = map(int, time_str.split(":"))
-            return hours * 60 + minutes
-        except (ValueError, AttributeError):
+            # Fast path for the zero-padded "HH:MM" format returned by the API
+            if len(time_str) == 5 and time_str[2] == ":":
+                return int(time_str[0:2]) * 60 + int(time_str[3:5])
+            hours, _, minutes = time_str.partition(":")
+            return int(hours) * 60 + int(minutes)
+        except (ValueError, AttributeError, TypeError):
             return 0
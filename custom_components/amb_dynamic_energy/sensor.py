@@ -2,7 +2,10 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
+from abc import abstractmethod
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from operator import attrgetter
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -13,9 +16,10 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 # UnitOfTime is kept for minutes display
 from homeassistant.const import UnitOfTime
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
@@ -23,6 +27,7 @@ from custom_components.amb_dynamic_energy.const import (
     DOMAIN,
     MANUFACTURER,
     MODEL,
+    ONE_DAY,
     SENSOR_CURRENT_PRICE,
     SENSOR_CURRENT_DURATION,
     SENSOR_PRICE_SCHEDULE,
@@ -33,10 +38,36 @@ from custom_components.amb_dynamic_energy.const import (
     ATTR_TOMORROW_SCHEDULE,
     ATTR_LAST_UPDATED,
 )
-from custom_components.amb_dynamic_energy.coordinator import AMBDataUpdateCoordinator
+from custom_components.amb_dynamic_energy.coordinator import (
+    AMBDataUpdateCoordinator,
+    ParsedPeriod,
+    PriceBlock,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+_START_MIN = attrgetter("start_min")
+_START_ABS_MIN = attrgetter("start_abs_min")
+
+
+def _get_schedule(data: dict[str, Any], date_str: str) -> tuple[ParsedPeriod, ...]:
+    """Return the schedule parsed by the coordinator for a date (empty if missing)."""
+    return data.get("schedules", {}).get(date_str, ())
+
+
+def _split_now(now: datetime) -> tuple[str, str, int]:
+    """Return today's and tomorrow's ISO dates and the minute of day for now."""
+    today = now.date()
+    return today.isoformat(), (today + ONE_DAY).isoformat(), now.hour * 60 + now.minute
+
+
+def _find_slot_index(schedule: tuple[ParsedPeriod, ...], current_minutes: int) -> int | None:
+    """Binary-search the sorted, disjoint schedule for the slot covering current_minutes."""
+    idx = bisect_right(schedule, current_minutes, key=_START_MIN) - 1
+    if idx >= 0 and current_minutes < schedule[idx].end_min:
+        return idx
+    return None
+
 
 async def async_setup_entry(
         hass: HomeAssistant,
@@ -44,419 +75,323 @@ async def async_setup_entry(
         async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up AMB Dynamic Energy sensors based on a config entry."""
-    coordinator: AMBDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator: AMBDataUpdateCoordinator = config_entry.runtime_data
+
+    # One DeviceInfo shared by every sensor of this entry
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, config_entry.entry_id)},
+        name="AMB Dynamic Energy Rate",
+        manufacturer=MANUFACTURER,
+        model=MODEL,
+        sw_version="1.1.0",
+    )
 
     sensors: list[SensorEntity] = [
-        AMBCurrentPriceSensor(coordinator, config_entry),
-        AMBCurrentDurationSensor(coordinator, config_entry),
-        AMBPriceScheduleSensor(coordinator, config_entry),
+        AMBCurrentPriceSensor(coordinator, config_entry, device_info),
+        AMBCurrentDurationSensor(coordinator, config_entry, device_info),
+        AMBPriceScheduleSensor(coordinator, config_entry, device_info),
     ]
 
-    async_add_entities(sensors, update_before_add=True)
+    async_add_entities(sensors)
 
 
 class AMBBaseSensor(CoordinatorEntity[AMBDataUpdateCoordinator], SensorEntity):
     """Base class for AMB Dynamic Energy sensors that rely on coordinator data."""
 
+    # HA's entity bases keep a __dict__; slots only keep our own fields out of it
+    __slots__ = ("_config_entry", "_sensor_type")
+
     def __init__(
             self,
             coordinator: AMBDataUpdateCoordinator,
             config_entry: ConfigEntry,
+            device_info: DeviceInfo,
             sensor_type: str,
     ) -> None:
         super().__init__(coordinator)
         self._config_entry = config_entry
         self._sensor_type = sensor_type
         self._attr_unique_id = f"{config_entry.entry_id}_{sensor_type}"
+        self._attr_device_info = device_info
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._config_entry.entry_id)},
-            name="AMB Dynamic Energy Rate",
-            manufacturer=MANUFACTURER,
-            model=MODEL,
-            sw_version="1.1.0",
+
+class AMBScheduledSensor(AMBBaseSensor):
+    """Base class for sensors whose state is derived from the clock and the forecast.
+
+    Instead of polling, the state is written when coordinator data changes and
+    at the next point in time returned by ``_next_update``.
+    """
+
+    __slots__ = ("_unsub_timer",)
+
+    def __init__(
+            self,
+            coordinator: AMBDataUpdateCoordinator,
+            config_entry: ConfigEntry,
+            device_info: DeviceInfo,
+            sensor_type: str,
+    ) -> None:
+        super().__init__(coordinator, config_entry, device_info, sensor_type)
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to coordinator updates and arm the first timer."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._cancel_timer)
+        self._schedule_next_update()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Re-arm the timer from the new data before writing state."""
+        self._schedule_next_update()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _handle_timer(self, _now: datetime) -> None:
+        self._unsub_timer = None
+        self._schedule_next_update()
+        self.async_write_ha_state()
+
+    @callback
+    def _schedule_next_update(self) -> None:
+        self._cancel_timer()
+        if not self.coordinator.data:
+            return
+        utc_now = dt_util.utcnow()
+        next_update = self._next_update(dt_util.as_local(utc_now))
+        if next_update is None:
+            return
+        if next_update <= utc_now:
+            # A wall-clock boundary inside the repeated DST hour can already be
+            # past; re-arming on it would fire again immediately
+            next_update = utc_now.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        self._unsub_timer = async_track_point_in_time(
+            self.hass, self._handle_timer, next_update
         )
 
+    @callback
+    def _cancel_timer(self) -> None:
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    @abstractmethod
+    def _next_update(self, now: datetime) -> datetime | None:
+        """Return the UTC instant when the state next needs to be recomputed."""
+
+
+class AMBCurrentPriceSensor(AMBScheduledSensor):
+    """Current electricity price level, updated at each forecast slot boundary."""
+
+    __slots__ = ("_slot_cache",)
 
-class AMBCurrentPriceSensor(SensorEntity):
-    """Current electricity price level computed in real-time with active polling."""
+    _attr_name = "Current Energy Price"
+    _attr_icon = "mdi:flash"
 
     def __init__(
             self,
             coordinator: AMBDataUpdateCoordinator,
             config_entry: ConfigEntry,
+            device_info: DeviceInfo,
     ) -> None:
-        self._coordinator = coordinator
-        self._config_entry = config_entry
-        self._attr_name = "Current Energy Price"
-        self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_CURRENT_PRICE}"
-        self._attr_icon = "mdi:flash"
-        self._attr_should_poll = True  # update ~ every 30s
+        super().__init__(coordinator, config_entry, device_info, SENSOR_CURRENT_PRICE)
+        # (coordinator data, date, minute of day, slot covering that minute)
+        self._slot_cache: tuple[dict[str, Any], str, int, ParsedPeriod | None] | None = None
 
-    @property
-    def available(self) -> bool:
-        return self._coordinator.last_update_success
+    def _next_update(self, now: datetime) -> datetime | None:
+        """Next slot start or end today, or local midnight when today is exhausted."""
+        today_str, _, current_minutes = _split_now(now)
+        today_sched = _get_schedule(self.coordinator.data, today_str)
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._config_entry.entry_id)},
-            name="AMB Dynamic Energy Rate",
-            manufacturer=MANUFACTURER,
-            model=MODEL,
-            sw_version="1.1.0",
-        )
+        boundary = 24 * 60
+        nxt = bisect_right(today_sched, current_minutes, key=_START_MIN)
+        if nxt < len(today_sched):
+            boundary = today_sched[nxt].start_min
+        if nxt > 0 and current_minutes < today_sched[nxt - 1].end_min:
+            boundary = min(boundary, today_sched[nxt - 1].end_min)
 
-    async def async_update(self) -> None:
-        return
+        # Wall-clock arithmetic, then UTC so the instant is right across DST changes
+        return dt_util.as_utc(dt_util.start_of_local_day(now) + timedelta(minutes=boundary))
 
     @property
     def native_value(self) -> str | None:
         """Return LOW/HIGH computed from the current time and today's forecast."""
-        if not self._coordinator.data:
+        if not self.coordinator.data:
             return None
-        price = self._calculate_current_price()
+        today_str, _, current_minutes = _split_now(dt_util.now())
+        period = self._current_slot(today_str, current_minutes)
+        price = period.price if period else None
         _LOGGER.debug("AMBCurrentPriceSensor computed price: %s", price)
-        return price.upper() if price else None
-
-    def _calculate_current_price(self) -> str | None:
-        """Calculate the current price by matching now against today's forecast ranges."""
-        forecasts = self._coordinator.data.get("forecasts", [])
-        now = dt_util.now()
-        today_str = now.strftime("%Y-%m-%d")
-        current_minutes = now.hour * 60 + now.minute
-
-        for day in forecasts:
-            if day.get("date") == today_str:
-                for period in day.get("forecast", []):
-                    rng = period.get("hour_range", "")
-                    if " - " not in rng:
-                        continue
-                    start_str, end_str = rng.split(" - ")
-                    start_m = self._time_to_minutes(start_str)
-                    end_m = 24 * 60 if end_str == "23:59" else self._time_to_minutes(end_str)
-                    if start_m <= current_minutes < end_m:
-                        return period.get("price", "unknown")
-        return None
+        return period.label if price else None
+
+    def _current_slot(self, today_str: str, current_minutes: int) -> ParsedPeriod | None:
+        """Return today's slot covering current_minutes, reusing the lookup within a minute.
+
+        native_value and extra_state_attributes are read back to back on every
+        state write, so the second read hits the cache.
+        """
+        data = self.coordinator.data
+        cache = self._slot_cache
+        if (
+            cache is not None
+            and cache[0] is data
+            and cache[2] == current_minutes
+            and cache[1] == today_str
+        ):
+            return cache[3]
+        today_sched = _get_schedule(data, today_str)
+        idx = _find_slot_index(today_sched, current_minutes)
+        period = today_sched[idx] if idx is not None else None
+        self._slot_cache = (data, today_str, current_minutes, period)
+        return period
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Expose current range, next change and last update time."""
-        if not self._coordinator.data:
+        if not self.coordinator.data:
             return {}
 
-        attrs: dict[str, Any] = {"last_calculated": dt_util.now().isoformat()}
-        attrs[ATTR_LAST_UPDATED] = self._coordinator.data.get("last_updated")
+        today_str, tomorrow_str, current_minutes = _split_now(dt_util.now())
+
+        # No per-read timestamp here: it would make every state write look changed
+        attrs: dict[str, Any] = {ATTR_LAST_UPDATED: self.coordinator.data.get("last_updated")}
 
-        current_info = self._get_current_period_info()
-        if current_info:
-            attrs[ATTR_CURRENT_RANGE] = f"{current_info['start']} - {current_info['end']}"
+        current_period = self._current_slot(today_str, current_minutes)
+        if current_period:
+            attrs[ATTR_CURRENT_RANGE] = f"{current_period.start} - {current_period.end}"
 
-        next_change = self._find_next_change()
+        next_change = self._find_next_change(today_str, tomorrow_str, current_minutes)
         if next_change:
+            next_date, next_period = next_change
             attrs[ATTR_NEXT_CHANGE] = (
-                f"{next_change['date']} {next_change['time']} ({next_change['price'].upper()})"
+                f"{next_date} {next_period.start} ({next_period.label})"
             )
 
         return attrs
 
-    def _get_current_period_info(self) -> dict[str, Any] | None:
-        forecasts = self._coordinator.data.get("forecasts", [])
-        now = dt_util.now()
-        today_str = now.strftime("%Y-%m-%d")
-        current_minutes = now.hour * 60 + now.minute
-
-        for day in forecasts:
-            if day.get("date") == today_str:
-                for period in day.get("forecast", []):
-                    rng = period.get("hour_range", "")
-                    if " - " not in rng:
-                        continue
-                    start_str, end_str = rng.split(" - ")
-                    start_m = self._time_to_minutes(start_str)
-                    end_m = 24 * 60 if end_str == "23:59" else self._time_to_minutes(end_str)
-                    if start_m <= current_minutes < end_m:
-                        return {"start": start_str, "end": end_str, "price": period.get("price")}
+    def _find_next_change(
+            self, today_str: str, tomorrow_str: str, current_minutes: int
+    ) -> tuple[str, ParsedPeriod] | None:
+        """Return the date and period of the next slot start."""
+        # First slot starting after now is right where bisect would insert now
+        today_sched = _get_schedule(self.coordinator.data, today_str)
+        nxt = bisect_right(today_sched, current_minutes, key=_START_MIN)
+        if nxt < len(today_sched):
+            return today_str, today_sched[nxt]
+
+        tomorrow_sched = _get_schedule(self.coordinator.data, tomorrow_str)
+        if tomorrow_sched:
+            return tomorrow_str, tomorrow_sched[0]
         return None
 
-    def _find_next_change(self) -> dict[str, Any] | None:
-        forecasts = self._coordinator.data.get("forecasts", [])
-        now = dt_util.now()
-        today_str = now.strftime("%Y-%m-%d")
-        tomorrow_str = (now + timedelta(days=1)).strftime("%Y-%m-%d")
-        current_minutes = now.hour * 60 + now.minute
-
-        for day in forecasts:
-            if day.get("date") == today_str:
-                for period in day.get("forecast", []):
-                    rng = period.get("hour_range", "")
-                    if " - " not in rng:
-                        continue
-                    start_str, _ = rng.split(" - ")
-                    start_m = self._time_to_minutes(start_str)
-                    if start_m > current_minutes:
-                        return {"time": start_str, "price": period.get("price"), "date": today_str}
-
-        for day in forecasts:
-            if day.get("date") == tomorrow_str:
-                fc = day.get("forecast", [])
-                if not fc:
-                    break
-                rng = fc[0].get("hour_range", "")
-                if " - " in rng:
-                    start_str, _ = rng.split(" - ")
-                    return {"time": start_str, "price": fc[0].get("price"), "date": tomorrow_str}
-        return None
 
-    @staticmethod
-    def _time_to_minutes(time_str: str) -> int:
-        try:
-            h, m = map(int, time_str.split(":"))
-            return h * 60 + m
-        except Exception:
-            return 0
+class AMBCurrentDurationSensor(AMBScheduledSensor):
+    """Remaining time in current price period, merging contiguous same-price slots across midnight."""
 
+    __slots__ = ("_block_cache",)
 
-class AMBCurrentDurationSensor(SensorEntity):
-    """Remaining time in current price period, merging contiguous same-price slots across midnight."""
+    _attr_name = "Current Price Period Remaining"
+    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:timer"
 
     def __init__(
             self,
             coordinator: AMBDataUpdateCoordinator,
             config_entry: ConfigEntry,
+            device_info: DeviceInfo,
     ) -> None:
-        self._coordinator = coordinator
-        self._config_entry = config_entry
-        self._attr_name = "Current Price Period Remaining"
-        self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_CURRENT_DURATION}"
-        self._attr_native_unit_of_measurement = UnitOfTime.MINUTES
-        self._attr_device_class = SensorDeviceClass.DURATION
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_icon = "mdi:timer"
-        self._attr_should_poll = True  # update ~ every 30s
-
-    @property
-    def available(self) -> bool:
-        return self._coordinator.last_update_success
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._config_entry.entry_id)},
-            name="AMB Dynamic Energy Rate",
-            manufacturer=MANUFACTURER,
-            model=MODEL,
-            sw_version="1.1.0",
-        )
+        super().__init__(coordinator, config_entry, device_info, SENSOR_CURRENT_DURATION)
+        # (coordinator data, absolute minute, block covering that minute)
+        self._block_cache: tuple[dict[str, Any], int, PriceBlock | None] | None = None
 
-    async def async_update(self) -> None:
-        return
+    def _next_update(self, now: datetime) -> datetime | None:
+        """The remaining minutes change at the start of every minute."""
+        # Step in UTC: a local "next minute" is off by an hour across a DST change
+        return dt_util.as_utc(now).replace(second=0, microsecond=0) + timedelta(minutes=1)
 
     @property
     def native_value(self) -> int | None:
         """Return remaining minutes in the merged current block (today + contiguous tomorrow if same price)."""
-        if not self._coordinator.data:
-            return None
-        remaining = self._calculate_merged_remaining()
-        if remaining is not None:
-            _LOGGER.debug("Merged remaining time: %s minutes", remaining)
-        return max(0, remaining) if remaining is not None else None
-
-    def _calculate_merged_remaining(self) -> int | None:
-        """Find current period today, then merge with following contiguous same-price slots today and tomorrow."""
-        forecasts = self._coordinator.data.get("forecasts", [])
-        now = dt_util.now()
-        today_str = now.strftime("%Y-%m-%d")
-        tomorrow_str = (now + timedelta(days=1)).strftime("%Y-%m-%d")
-        current_minutes = now.hour * 60 + now.minute
-
-        # Build today schedule
-        today_sched = self._build_schedule_for_date(forecasts, today_str)
-        if not today_sched:
+        if not self.coordinator.data:
             return None
-
-        # Find current slot in today schedule
-        idx = None
-        for i, slot in enumerate(today_sched):
-            if slot["start_m"] <= current_minutes < slot["end_m"]:
-                idx = i
-                break
-        if idx is None:
+        found = self._find_current_block(dt_util.now())
+        if found is None:
             return None
-
-        current_price = today_sched[idx]["price"]
-        merged_end = today_sched[idx]["end_m"]
-
-        # Merge with following slots today if contiguous and same price
-        i = idx + 1
-        while i < len(today_sched):
-            nxt = today_sched[i]
-            if nxt["start_m"] == merged_end and nxt["price"] == current_price:
-                merged_end = nxt["end_m"]
-                i += 1
-            else:
-                break
-
-        # If merged_end reaches end of day and tomorrow is available, merge with tomorrow's contiguous head
-        if merged_end >= 24 * 60:
-            tomorrow_sched = self._build_schedule_for_date(forecasts, tomorrow_str)
-            if tomorrow_sched:
-                j = 0
-                # Start of tomorrow must be contiguous (00:00) and same price
-                while j < len(tomorrow_sched):
-                    slot = tomorrow_sched[j]
-                    if j == 0 and slot["start_m"] == 0 and slot["price"] == current_price:
-                        # Extend beyond midnight: add minutes from tomorrow
-                        merged_end = 24 * 60 + slot["end_m"]
-                        j += 1
-                        # Chain more contiguous same-price slots tomorrow if needed
-                        while j < len(tomorrow_sched):
-                            next_slot = tomorrow_sched[j]
-                            prev_end = merged_end - 24 * 60  # end within tomorrow day-space
-                            if next_slot["start_m"] == prev_end and next_slot["price"] == current_price:
-                                merged_end = 24 * 60 + next_slot["end_m"]
-                                j += 1
-                            else:
-                                break
-                        break
-                    else:
-                        break
-
-        # Remaining is merged_end - now
-        return merged_end - current_minutes
-
-    def _build_schedule_for_date(self, forecasts: list, date_str: str) -> list[dict[str, Any]]:
-        """Return normalized schedule list: [{start_m, end_m, price}] for given date."""
-        for day in forecasts:
-            if day.get("date") == date_str:
-                result: list[dict[str, Any]] = []
-                for period in day.get("forecast", []):
-                    rng = period.get("hour_range", "")
-                    if " - " not in rng:
-                        continue
-                    start_str, end_str = rng.split(" - ")
-                    start_m = self._time_to_minutes(start_str)
-                    end_m = 24 * 60 if end_str == "23:59" else self._time_to_minutes(end_str)
-                    result.append({"start_m": start_m, "end_m": end_m, "price": period.get("price", "unknown")})
-                # Ensure sorted and contiguous logic works
-                result.sort(key=lambda x: x["start_m"])
-                return result
-        return []
+        block, now_abs = found
+        # _find_current_block only returns blocks ending after now: always positive
+        remaining = block.end_abs_min - now_abs
+        _LOGGER.debug("Merged remaining time: %s minutes", remaining)
+        return remaining
+
+    def _find_current_block(self, now: datetime) -> tuple[PriceBlock, int] | None:
+        """Locate the precomputed merged block covering now, with now in absolute minutes."""
+        now_abs = now.date().toordinal() * 24 * 60 + now.hour * 60 + now.minute
+
+        data = self.coordinator.data
+        cache = self._block_cache
+        if cache is not None and cache[0] is data and cache[1] == now_abs:
+            block = cache[2]
+        else:
+            # native_value and the attributes share one lookup per minute
+            blocks = data.get("price_blocks", ())
+            idx = bisect_right(blocks, now_abs, key=_START_ABS_MIN) - 1
+            block = blocks[idx] if idx >= 0 and now_abs < blocks[idx].end_abs_min else None
+            self._block_cache = (data, now_abs, block)
+        return (block, now_abs) if block is not None else None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Attributes include formatted remaining and merged-until timestamp for debug."""
-        if not self._coordinator.data:
+        if not self.coordinator.data:
             return {}
 
-        attrs: dict[str, Any] = {"last_calculated": dt_util.now().isoformat()}
-
-        remaining = self.native_value
-        if remaining is not None:
-            if remaining >= 60:
-                hours = remaining // 60
-                minutes = remaining % 60
-                attrs["remaining_formatted"] = f"{hours}h {minutes}m"
-            else:
-                attrs["remaining_formatted"] = f"{remaining}m"
-
-        # Also expose current merged end human-friendly for troubleshooting
-        merged_end_info = self._current_merged_end_info()
-        if merged_end_info:
-            attrs.update(merged_end_info)
-
-        return attrs
-
-    def _current_merged_end_info(self) -> dict[str, Any] | None:
-        """Return details about the merged end window for visibility."""
-        forecasts = self._coordinator.data.get("forecasts", [])
-        now = dt_util.now()
-        today_str = now.strftime("%Y-%m-%d")
-        tomorrow_str = (now + timedelta(days=1)).strftime("%Y-%m-%d")
-        current_minutes = now.hour * 60 + now.minute
-
-        today_sched = self._build_schedule_for_date(forecasts, today_str)
-        if not today_sched:
-            return None
-
-        # Find current slot
-        idx = None
-        for i, slot in enumerate(today_sched):
-            if slot["start_m"] <= current_minutes < slot["end_m"]:
-                idx = i
-                break
-        if idx is None:
-            return None
+        # One lookup serves both the remaining time and the merged end details
+        found = self._find_current_block(dt_util.now())
+        if found is None:
+            return {}
+        block, now_abs = found
 
-        current_price = today_sched[idx]["price"]
-        merged_end_m = today_sched[idx]["end_m"]
-
-        # Merge within today
-        i = idx + 1
-        while i < len(today_sched):
-            nxt = today_sched[i]
-            if nxt["start_m"] == merged_end_m and nxt["price"] == current_price:
-                merged_end_m = nxt["end_m"]
-                i += 1
-            else:
-                break
-
-        merged_date = today_str
-        # Merge into tomorrow head if contiguous
-        if merged_end_m >= 24 * 60:
-            tomorrow_sched = self._build_schedule_for_date(forecasts, tomorrow_str)
-            if tomorrow_sched and tomorrow_sched[0]["start_m"] == 0 and tomorrow_sched[0]["price"] == current_price:
-                merged_end_m = 24 * 60 + tomorrow_sched[0]["end_m"]
-                j = 1
-                while j < len(tomorrow_sched):
-                    prev_end = merged_end_m - 24 * 60
-                    nxt = tomorrow_sched[j]
-                    if nxt["start_m"] == prev_end and nxt["price"] == current_price:
-                        merged_end_m = 24 * 60 + nxt["end_m"]
-                        j += 1
-                    else:
-                        break
-                merged_date = tomorrow_str
-
-        # Build HH:MM end for attributes
-        end_total_m = merged_end_m
-        if end_total_m < 24 * 60:
-            end_h = end_total_m // 60
-            end_min = end_total_m % 60
-            end_label = f"{today_str} {end_h:02d}:{end_min:02d}"
+        remaining = block.end_abs_min - now_abs
+        if remaining >= 60:
+            hours = remaining // 60
+            minutes = remaining % 60
+            remaining_formatted = f"{hours}h {minutes}m"
         else:
-            within_tomorrow = end_total_m - 24 * 60
-            end_h = within_tomorrow // 60
-            end_min = within_tomorrow % 60
-            end_label = f"{tomorrow_str} {end_h:02d}:{end_min:02d}"
+            remaining_formatted = f"{remaining}m"
 
+        # Also expose current merged end human-friendly for troubleshooting
         return {
-            "merged_until": end_label,
-            "merged_price": current_price.upper(),
+            "remaining_formatted": remaining_formatted,
+            "merged_until": block.end_label,
+            "merged_price": block.label,
         }
 
-    @staticmethod
-    def _time_to_minutes(time_str: str) -> int:
-        try:
-            h, m = map(int, time_str.split(":"))
-            return h * 60 + m
-        except Exception:
-            return 0
-
 
 class AMBPriceScheduleSensor(AMBBaseSensor):
     """Sensor for complete price schedule and forecasts (for charts/UI)."""
 
+    __slots__ = ("_attrs_cache",)
+
+    _attr_name = "Energy Price Schedule"
+    _attr_icon = "mdi:calendar-clock"
+
     def __init__(
             self,
             coordinator: AMBDataUpdateCoordinator,
             config_entry: ConfigEntry,
+            device_info: DeviceInfo,
     ) -> None:
-        super().__init__(coordinator, config_entry, SENSOR_PRICE_SCHEDULE)
-        self._attr_name = "Energy Price Schedule"
-        self._attr_icon = "mdi:calendar-clock"
+        super().__init__(coordinator, config_entry, device_info, SENSOR_PRICE_SCHEDULE)
+        # (coordinator data, attributes built from it)
+        self._attrs_cache: tuple[dict[str, Any], dict[str, Any]] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Drop the cached attributes when new coordinator data arrives."""
+        self._attrs_cache = None
+        super()._handle_coordinator_update()
 
     @property
     def native_value(self) -> str | None:
@@ -471,39 +406,18 @@ class AMBPriceScheduleSensor(AMBBaseSensor):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return {}
+        # Same data object, same attributes: return the dict built last time
+        if self._attrs_cache is not None and self._attrs_cache[0] is data:
+            return self._attrs_cache[1]
         attrs = {
-            ATTR_TODAY_SCHEDULE: self.coordinator.data.get("today_schedule", []),
-            ATTR_TOMORROW_SCHEDULE: self.coordinator.data.get("tomorrow_schedule", []),
-            ATTR_FORECASTS: self.coordinator.data.get("forecasts", []),
-            ATTR_LAST_UPDATED: self.coordinator.data.get("last_updated"),
+            ATTR_TODAY_SCHEDULE: data.get("today_schedule", []),
+            ATTR_TOMORROW_SCHEDULE: data.get("tomorrow_schedule", []),
+            ATTR_FORECASTS: data.get("forecasts", []),
+            ATTR_LAST_UPDATED: data.get("last_updated"),
         }
-        attrs["chart_data"] = self._generate_chart_data()
+        attrs["chart_data"] = data.get("chart_data", {})
+        self._attrs_cache = (data, attrs)
         return attrs
-
-    def _generate_chart_data(self) -> list[dict[str, Any]]:
-        if not self.coordinator.data:
-            return []
-        chart_data: list[dict[str, Any]] = []
-        forecasts = self.coordinator.data.get("forecasts", [])
-        for day in forecasts:
-            date_str = day.get("date")
-            for period in day.get("forecast", []):
-                rng = period.get("hour_range", "")
-                price = period.get("price", "unknown")
-                if " - " not in rng:
-                    continue
-                start_str, end_str = rng.split(" - ")
-                price_value = 1 if price == "high" else 0
-                chart_data.append(
-                    {
-                        "date": date_str,
-                        "start_time": start_str,
-                        "end_time": end_str,
-                        "price": price,
-                        "price_value": price_value,
-                        "timestamp": f"{date_str}T{start_str}:00",
-                    }
-                )
-        return chart_data